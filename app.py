@@ -1,9 +1,14 @@
 import streamlit as st
 import pandas as pd
 import base64
+import sys
 from heart_disease_model import predict_heart_disease
 from diet_recommendations import get_diet_recommendations
 from report_generator import generate_report
+from prediction_monitor import get_monitor
+
+# Drift monitoring for predictions made by this process
+MONITOR = get_monitor("app")
 
 # Set page config
 st.set_page_config(
@@ -218,6 +223,13 @@ with tab1:
                 # Get diet recommendations
                 diet_recommendations = get_diet_recommendations(has_heart_disease, input_data)
                 
+                # Record the prediction for drift monitoring, which must never
+                # stop the user from getting their result
+                try:
+                    MONITOR.observe(input_data, has_heart_disease, diet_recommendations)
+                except Exception as e:
+                    print(f"Could not record prediction for monitoring: {e}", file=sys.stderr)
+                
                 # Determine result color and message
                 if has_heart_disease:
                     result_color = "red"
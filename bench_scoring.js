@@ -0,0 +1,123 @@
+const { spawn } = require('child_process');
+const os = require('os');
+const path = require('path');
+const { ScoringClient } = require('./scoringClient');
+
+// Benchmark the scoring worker end to end.
+//
+// Usage:
+//   npm run bench:scoring -- [--requests 5000] [--pool 4] [--url http://localhost:5000]
+//
+// Starts its own worker with --no-monitor on a temporary socket, so the
+// synthetic traffic never reaches the drift monitoring snapshots. Reports the
+// bare IPC round trip (PING), a full assessment over the socket, pipelined
+// assessment throughput and, when --url is given, the Express /api/predict
+// endpoint. That endpoint goes through the server's own worker, so start it
+// with monitoring off too:
+//   python scoring_server.py --no-monitor & node server.js
+
+function parseArgs(argv) {
+  const args = { requests: 5000, pool: 4, url: null };
+  for (let i = 0; i < argv.length; i += 2) {
+    const key = argv[i].replace(/^--/, '');
+    args[key] = key === 'url' ? argv[i + 1] : parseInt(argv[i + 1]);
+  }
+  return args;
+}
+
+function randomInput() {
+  const randint = (low, high) => low + Math.floor(Math.random() * (high - low + 1));
+  return {
+    age: randint(20, 80),
+    sex: randint(0, 1),
+    blood_pressure: randint(90, 180),
+    cholesterol: randint(150, 350),
+    chest_pain_type: randint(0, 3)
+  };
+}
+
+function summarize(samples) {
+  const sorted = samples.slice().sort((a, b) => a - b);
+  const pct = (p) => sorted[Math.max(0, Math.ceil(sorted.length * p / 100) - 1)];
+  return {
+    p50_us: Math.round(pct(50)),
+    p90_us: Math.round(pct(90)),
+    p99_us: Math.round(pct(99)),
+    max_us: Math.round(sorted[sorted.length - 1])
+  };
+}
+
+// Time each request on its own, one at a time
+async function sequential(count, fn) {
+  const samples = [];
+  for (let i = 0; i < count; i++) {
+    const start = process.hrtime.bigint();
+    await fn();
+    samples.push(Number(process.hrtime.bigint() - start) / 1000);
+  }
+  return summarize(samples);
+}
+
+// Issue every request at once and measure completed requests per second
+async function pipelined(count, fn) {
+  const start = process.hrtime.bigint();
+  await Promise.all(Array.from({ length: count }, fn));
+  const seconds = Number(process.hrtime.bigint() - start) / 1e9;
+  return { requests: count, per_second: Math.round(count / seconds) };
+}
+
+// Start an unmonitored worker and resolve once it is listening
+function startWorker(socketPath) {
+  const python = process.env.PYTHON || 'python';
+  const worker = spawn(python, ['scoring_server.py', '--socket', socketPath, '--no-monitor'], {
+    cwd: __dirname,
+    stdio: ['ignore', 'pipe', 'inherit']
+  });
+  return new Promise((resolve, reject) => {
+    worker.on('error', reject);
+    worker.on('exit', (code) => reject(new Error(`Scoring worker exited with code ${code}`)));
+    worker.stdout.on('data', (chunk) => {
+      if (chunk.toString('utf8').includes('listening')) {
+        resolve(worker);
+      }
+    });
+  });
+}
+
+async function main() {
+  const args = parseArgs(process.argv.slice(2));
+  const socketPath = path.join(os.tmpdir(), `heart_scoring_bench_${process.pid}.sock`);
+  const worker = await startWorker(socketPath);
+  const client = new ScoringClient({ socketPath, poolSize: args.pool });
+
+  let results;
+  try {
+    // Warm up connections and the model
+    await Promise.all(Array.from({ length: args.pool * 4 }, () => client.assess(randomInput())));
+
+    results = {
+      ping: await sequential(args.requests, () => client.ping()),
+      assess: await sequential(args.requests, () => client.assess(randomInput())),
+      assess_pipelined: await pipelined(args.requests, () => client.assess(randomInput()))
+    };
+
+    if (args.url) {
+      const predict = () => fetch(`${args.url}/api/predict`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ...randomInput(), sex: 'Male', name: 'Benchmark' })
+      }).then((res) => res.json());
+      results.http_predict = await sequential(Math.min(args.requests, 1000), predict);
+    }
+  } finally {
+    client.close();
+    worker.kill('SIGTERM');
+  }
+
+  console.log(JSON.stringify(results, null, 2));
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
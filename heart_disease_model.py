@@ -2,13 +2,13 @@ import pandas as pd
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 
-# Create a simple but effective heart disease prediction model
-def create_model():
-    # Using simplified weights based on medical literature
-    # This is not a production-grade model, but serves as a demonstration
-    # In a real application, you would use a properly trained ML model
-    model = RandomForestClassifier(n_estimators=100, random_state=42)
+def generate_training_data():
+    """
+    Generate the synthetic data the model is trained on.
     
+    Returns:
+        tuple: (DataFrame of features, array of 0/1 targets)
+    """
     # Create some synthetic data to train the model
     # This would be replaced with real training data in a production environment
     np.random.seed(42)
@@ -40,6 +40,17 @@ def create_model():
         'chest_pain_type': chest_pain
     })
     
+    return X, target
+
+# Create a simple but effective heart disease prediction model
+def create_model():
+    # Using simplified weights based on medical literature
+    # This is not a production-grade model, but serves as a demonstration
+    # In a real application, you would use a properly trained ML model
+    model = RandomForestClassifier(n_estimators=100, random_state=42)
+    
+    X, target = generate_training_data()
+    
     # Train model
     model.fit(X, target)
     
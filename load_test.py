@@ -0,0 +1,762 @@
+"""
+Concurrent-session load test for the Streamlit app.
+
+Drives simulated user sessions through the form-submit flow: each session
+loads app.py, fills in the health assessment form and submits it. There
+are two ways to run the sessions:
+
+server (default)
+    Starts `streamlit run app.py` locally and drives every session over its
+    websocket, as a browser would. All sessions share the one Streamlit
+    process, just like a deployed instance, so the saturation point and
+    per-session memory size that process. Needs the `websockets` package.
+
+apptest
+    Runs each session with Streamlit's headless script runner
+    (streamlit.testing.v1.AppTest). AppTest swaps process-global Streamlit
+    state while it runs, so concurrent sessions each get their own worker
+    process. Throughput then scales with the CPU cores of this machine,
+    not with what one Streamlit process can serve; use it to profile the
+    script itself, not to size an instance.
+
+Usage:
+    python load_test.py --levels 1,2,4,8,16 --sessions 32 --output report.json
+
+The report contains per-step latency percentiles for every concurrency
+level, the throughput at each level and where it stops scaling, and the
+memory retained by each live session. Runs are seeded so that two releases
+can be compared with the same inputs.
+"""
+import argparse
+import asyncio
+import datetime
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+import urllib.request
+
+from streamlit.testing.v1 import AppTest
+
+# Keep synthetic load out of the prediction monitoring snapshots, even when
+# the shell sets a snapshot path. Worker processes and the Streamlit server
+# inherit this too.
+os.environ["HEART_MONITOR_PATH"] = ""
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_SCRIPT = "app.py"
+STEPS = ("load", "submit")
+MODES = ("server", "apptest")
+
+MODE_NOTES = {
+    'server': "All sessions share one local `streamlit run` process, as on a deployed instance.",
+    'apptest': (
+        "Each concurrent session runs in its own process, so throughput and "
+        "saturation reflect this machine's CPU cores, not the capacity of one "
+        "Streamlit process."
+    ),
+}
+
+# Throughput must improve by at least this fraction when concurrency is
+# raised for the level to count as still scaling
+SATURATION_GAIN = 0.10
+
+# Seed for the untimed session run before timing starts
+WARM_UP_SEED = 0
+
+# Extra seconds allowed on top of the script-run timeout for starting
+# Streamlit and training the model
+STARTUP_GRACE = 60
+
+
+def random_form_input(rng):
+    """
+    Generate a random but valid set of form values.
+
+    Args:
+        rng (random.Random): Seeded random generator
+
+    Returns:
+        dict: Form values keyed by field
+    """
+    return {
+        'name': f"Load Test {rng.randint(1, 10**6)}",
+        'age': rng.randint(20, 80),
+        'sex': rng.choice(["Male", "Female"]),
+        'blood_pressure': rng.randint(90, 180),
+        'cholesterol': rng.randint(150, 350),
+        'chest_pain_type': str(rng.randint(0, 3)),
+    }
+
+
+def run_apptest(at):
+    """
+    Run an AppTest script, then put back this process's __main__ module.
+
+    Streamlit's script runner leaves sys.modules['__main__'] pointing at
+    app.py, after which multiprocessing can no longer find the worker
+    functions of this module by name.
+    """
+    main_module = sys.modules['__main__']
+    try:
+        return at.run()
+    finally:
+        sys.modules['__main__'] = main_module
+
+
+def run_session(form_input, timeout):
+    """
+    Run one AppTest session: load the page, then fill in and submit the form.
+
+    Args:
+        form_input (dict): Form values from random_form_input
+        timeout (float): Seconds allowed for each script run
+
+    Returns:
+        tuple: (AppTest session, dict of step name to latency in seconds)
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    at = AppTest.from_file(APP_SCRIPT, default_timeout=timeout)
+    run_apptest(at)
+    timings['load'] = time.perf_counter() - start
+
+    at.text_input[0].input(form_input['name'])
+    at.number_input[0].set_value(form_input['age'])
+    at.number_input[1].set_value(form_input['blood_pressure'])
+    at.number_input[2].set_value(form_input['cholesterol'])
+    at.selectbox[0].select(form_input['sex'])
+    at.selectbox[1].select(form_input['chest_pain_type'])
+
+    start = time.perf_counter()
+    run_apptest(at.button[0].click())
+    timings['submit'] = time.perf_counter() - start
+
+    if at.exception or at.error:
+        raise RuntimeError(f"Session failed: {at.exception or at.error}")
+
+    return at, timings
+
+
+def init_worker(timeout, barrier):
+    """
+    Warm up a worker process, then wait until every worker has done so.
+
+    Importing Streamlit and training the model on the first run takes far
+    longer than a session, so it must not land inside the timed run.
+
+    Args:
+        timeout (float): Seconds allowed for each script run
+        barrier (multiprocessing.Barrier): Shared by all workers of the pool
+    """
+    try:
+        run_session(random_form_input(random.Random(WARM_UP_SEED)), timeout)
+    except Exception:
+        # A broken app shows up as failures in the timed sessions
+        pass
+    try:
+        barrier.wait(timeout=2 * timeout + STARTUP_GRACE)
+    except threading.BrokenBarrierError:
+        # A sibling died while warming up; run_level reports the timeout
+        pass
+
+
+def worker_ready():
+    return True
+
+
+def timed_session(args):
+    """
+    Run one session in a worker process.
+
+    Args:
+        args (tuple): (form input, timeout)
+
+    Returns:
+        tuple: (dict of step latencies or None, error message or None)
+    """
+    form_input, timeout = args
+    try:
+        _, timings = run_session(form_input, timeout)
+    except Exception as e:
+        return None, str(e)
+    return timings, None
+
+
+def run_apptest_sessions(concurrency, inputs, timeout):
+    """
+    Run AppTest sessions in `concurrency` worker processes.
+
+    Args:
+        concurrency (int): Number of worker processes
+        inputs (list): Form inputs, one per session
+        timeout (float): Seconds allowed for each script run
+
+    Returns:
+        tuple: (list of (timings, error) per session, elapsed seconds)
+    """
+    outcomes = []
+    session_timeout = 2 * timeout + STARTUP_GRACE
+
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(concurrency)
+    with context.Pool(concurrency, initializer=init_worker, initargs=(timeout, barrier)) as pool:
+        # Returns once every worker has warmed up and passed the barrier
+        try:
+            pool.apply_async(worker_ready).get(timeout=2 * session_timeout)
+        except multiprocessing.TimeoutError:
+            error = "Worker processes did not start"
+            return [(None, error)] * len(inputs), 0.0
+
+        start = time.perf_counter()
+        results = pool.imap_unordered(timed_session, [(form_input, timeout) for form_input in inputs])
+        for _ in inputs:
+            try:
+                outcomes.append(results.next(timeout=session_timeout))
+            except multiprocessing.TimeoutError:
+                # A worker died and took its session with it
+                break
+        elapsed = time.perf_counter() - start
+
+    outcomes += [(None, "Session lost: worker did not respond")] * (len(inputs) - len(outcomes))
+    return outcomes, elapsed
+
+
+class StreamlitServer:
+    """
+    A local `streamlit run app.py` process driven over its websocket.
+    """
+
+    def __init__(self, timeout):
+        """
+        Args:
+            timeout (float): Seconds allowed for each script run
+        """
+        import websockets  # noqa: F401 - fail before starting the server
+
+        self.timeout = timeout
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            self.port = probe.getsockname()[1]
+        self.url = f"ws://127.0.0.1:{self.port}/_stcore/stream"
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", APP_SCRIPT,
+             "--server.headless", "true",
+             "--server.address", "127.0.0.1",
+             "--server.port", str(self.port),
+             "--browser.gatherUsageStats", "false"],
+            cwd=APP_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        self.wait_until_healthy()
+
+    def wait_until_healthy(self):
+        deadline = time.monotonic() + STARTUP_GRACE
+        health_url = f"http://127.0.0.1:{self.port}/_stcore/health"
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"streamlit exited with code {self.process.returncode}")
+            try:
+                with urllib.request.urlopen(health_url, timeout=1) as response:
+                    if response.status == 200:
+                        return
+            except OSError:
+                time.sleep(0.2)
+        self.close()
+        raise RuntimeError("streamlit did not become healthy in time")
+
+    def rss_kib(self):
+        """
+        Resident memory of the Streamlit process in KiB (Linux only).
+        """
+        with open(f"/proc/{self.process.pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+        return None
+
+    def close(self):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+async def server_rerun(ws, client_state, timeout):
+    """
+    Ask the server to rerun the script and wait for it to finish.
+
+    Args:
+        ws: Open websocket to the Streamlit server
+        client_state (ClientState): Widget values to rerun with
+        timeout (float): Seconds allowed for the script run
+
+    Returns:
+        tuple: (dict of element type to list of elements, list of markdown bodies)
+    """
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    back_msg = BackMsg()
+    back_msg.rerun_script.CopyFrom(client_state)
+    await ws.send(back_msg.SerializeToString())
+
+    elements = {}
+    deadline = time.monotonic() + timeout
+    while True:
+        msg = ForwardMsg()
+        msg.ParseFromString(await asyncio.wait_for(ws.recv(), deadline - time.monotonic()))
+        kind = msg.WhichOneof("type")
+        if kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            element = msg.delta.new_element
+            element_type = element.WhichOneof("type")
+            elements.setdefault(element_type, []).append(getattr(element, element_type))
+        elif kind == "script_finished":
+            break
+
+    errors = elements.get('exception', []) + elements.get('alert', [])
+    if errors:
+        raise RuntimeError(f"Session failed: {errors[0]}")
+    return elements
+
+
+def form_client_state(elements, form_input):
+    """
+    Build the widget values a browser sends when the form is submitted.
+
+    Args:
+        elements (dict): Elements from the first run of the page
+        form_input (dict): Form values from random_form_input
+
+    Returns:
+        ClientState: Widget states for the submit rerun
+    """
+    from streamlit.proto.ClientState_pb2 import ClientState
+
+    client_state = ClientState()
+
+    def widget_state(element):
+        state = client_state.widget_states.widgets.add()
+        state.id = element.id
+        return state
+
+    widget_state(elements['text_input'][0]).string_value = form_input['name']
+
+    numbers = (form_input['age'], form_input['blood_pressure'], form_input['cholesterol'])
+    for element, value in zip(elements['number_input'], numbers):
+        if element.data_type == element.INT:
+            widget_state(element).int_value = value
+        else:
+            widget_state(element).double_value = value
+
+    sex, chest_pain = elements['selectbox']
+    choices = (
+        (sex, list(sex.options).index(form_input['sex'])),
+        (chest_pain, int(form_input['chest_pain_type'])),
+    )
+    for element, index in choices:
+        # Newer Streamlit sends the chosen label, older releases its index
+        if 'accept_new_options' in element.DESCRIPTOR.fields_by_name:
+            widget_state(element).string_value = element.options[index]
+        else:
+            widget_state(element).int_value = index
+
+    widget_state(elements['button'][0]).trigger_value = True
+    return client_state
+
+
+async def server_session(url, form_input, timeout, hold=None, parked=None):
+    """
+    Run one session against the Streamlit server.
+
+    Args:
+        url (str): Websocket URL of the server
+        form_input (dict): Form values from random_form_input
+        timeout (float): Seconds allowed for each script run
+        hold (asyncio.Event): If given, keep the session open until it is set
+        parked (asyncio.Event): Set once the session is waiting on `hold`
+
+    Returns:
+        dict: Step name to latency in seconds
+    """
+    import websockets
+    from streamlit.proto.ClientState_pb2 import ClientState
+
+    timings = {}
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None,
+                                  open_timeout=timeout) as ws:
+        start = time.perf_counter()
+        elements = await server_rerun(ws, ClientState(), timeout)
+        timings['load'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        elements = await server_rerun(ws, form_client_state(elements, form_input), timeout)
+        timings['submit'] = time.perf_counter() - start
+
+        if not any("data:application/pdf" in m.body for m in elements.get('markdown', [])):
+            raise RuntimeError("Session failed: no report link after submitting the form")
+
+        if hold is not None:
+            if parked is not None:
+                parked.set()
+            await hold.wait()
+    return timings
+
+
+async def run_server_sessions_async(url, concurrency, inputs, timeout):
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one(form_input):
+        async with limit:
+            try:
+                return await server_session(url, form_input, timeout), None
+            except Exception as e:
+                return None, str(e) or type(e).__name__
+
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(*(one(form_input) for form_input in inputs))
+    return list(outcomes), time.perf_counter() - start
+
+
+def run_server_sessions(server, concurrency, inputs, timeout):
+    """
+    Run sessions against the Streamlit server, `concurrency` at a time.
+
+    Returns:
+        tuple: (list of (timings, error) per session, elapsed seconds)
+    """
+    return asyncio.run(run_server_sessions_async(server.url, concurrency, inputs, timeout))
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of a list of numbers.
+
+    Args:
+        values (list): Sample values
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The percentile value, or None for an empty sample
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(values):
+    """
+    Summarize latencies (seconds) as milliseconds percentiles.
+    """
+    return {
+        'count': len(values),
+        'p50_ms': round(percentile(values, 50) * 1000, 2),
+        'p90_ms': round(percentile(values, 90) * 1000, 2),
+        'p99_ms': round(percentile(values, 99) * 1000, 2),
+        'max_ms': round(max(values) * 1000, 2),
+    }
+
+
+def run_level(concurrency, n_sessions, rng, timeout, server=None):
+    """
+    Run n_sessions sessions with at most `concurrency` running at once.
+
+    Args:
+        concurrency (int): Number of simultaneous sessions
+        n_sessions (int): Total sessions to run at this level
+        rng (random.Random): Seeded random generator for form inputs
+        timeout (float): Seconds allowed for each script run
+        server (StreamlitServer): Server to drive, or None for AppTest mode
+
+    Returns:
+        dict: Latency percentiles per step, throughput and failure count
+    """
+    inputs = [random_form_input(rng) for _ in range(n_sessions)]
+    if server is None:
+        outcomes, elapsed = run_apptest_sessions(concurrency, inputs, timeout)
+    else:
+        outcomes, elapsed = run_server_sessions(server, concurrency, inputs, timeout)
+
+    step_latencies = {step: [] for step in STEPS}
+    failures = []
+    for timings, error in outcomes:
+        if error is not None:
+            failures.append(error)
+            continue
+        for step in STEPS:
+            step_latencies[step].append(timings[step])
+
+    completed = len(step_latencies['submit'])
+    return {
+        'concurrency': concurrency,
+        'sessions': n_sessions,
+        'completed': completed,
+        'failures': len(failures),
+        'first_failure': failures[0] if failures else None,
+        'elapsed_s': round(elapsed, 3),
+        'throughput_sessions_per_s': round(completed / elapsed, 3) if elapsed else 0.0,
+        'steps': {
+            step: summarize(latencies)
+            for step, latencies in step_latencies.items() if latencies
+        },
+    }
+
+
+def find_saturation(levels):
+    """
+    Find the concurrency level where throughput stops scaling.
+
+    A level where any session failed counts as saturated, whatever its
+    throughput.
+
+    Args:
+        levels (list): Results from run_level, in increasing concurrency
+
+    Returns:
+        int: The last concurrency level that still improved throughput by
+            SATURATION_GAIN without failures (the lowest level if even that
+            one failed), or None if throughput kept scaling throughout
+    """
+    if levels and levels[0]['failures']:
+        return levels[0]['concurrency']
+    for previous, current in zip(levels, levels[1:]):
+        if current['failures']:
+            return previous['concurrency']
+        gain = current['throughput_sessions_per_s'] / max(previous['throughput_sessions_per_s'], 1e-9) - 1
+        if gain < SATURATION_GAIN:
+            return previous['concurrency']
+    return None
+
+
+def memory_summary(growth, **extra):
+    return {
+        'sessions': len(growth),
+        'per_session_kib': [round(g, 1) for g in growth],
+        'mean_kib': round(sum(growth) / len(growth), 1),
+        'max_kib': round(max(growth), 1),
+        **extra,
+    }
+
+
+def measure_apptest_memory(n_sessions, rng, timeout):
+    """
+    Measure the memory each live AppTest session keeps alive.
+
+    Sessions are run one after another and held open, as the server holds
+    them between reruns, so the growth after each one can be attributed to
+    that session alone.
+
+    Args:
+        n_sessions (int): Number of sessions to open
+        rng (random.Random): Seeded random generator for form inputs
+        timeout (float): Seconds allowed for each script run
+
+    Returns:
+        dict: Per-session memory growth in KiB
+    """
+    # Warm up imports and the model so they are not charged to a session
+    warm_up, _ = run_session(random_form_input(rng), timeout)
+    del warm_up
+
+    sessions = []
+    growth = []
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(n_sessions):
+            at, _ = run_session(random_form_input(rng), timeout)
+            sessions.append(at)
+            gc.collect()
+            current, _ = tracemalloc.get_traced_memory()
+            growth.append((current - baseline) / 1024)
+            baseline = current
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return memory_summary(growth, measured='tracemalloc', peak_traced_kib=round(peak / 1024, 1))
+
+
+async def measure_server_memory_async(server, n_sessions, rng, timeout):
+    hold = asyncio.Event()
+    open_sessions = []
+    growth = []
+    try:
+        baseline = server.rss_kib()
+        for _ in range(n_sessions):
+            parked = asyncio.Event()
+            task = asyncio.ensure_future(
+                server_session(server.url, random_form_input(rng), timeout, hold, parked)
+            )
+            open_sessions.append(task)
+
+            # Wait until the session has submitted the form and stays connected
+            parked_wait = asyncio.ensure_future(parked.wait())
+            await asyncio.wait({task, parked_wait}, return_when=asyncio.FIRST_COMPLETED)
+            parked_wait.cancel()
+            if task.done():
+                task.result()  # re-raises the session's failure
+
+            current = server.rss_kib()
+            growth.append(current - baseline)
+            baseline = current
+    finally:
+        hold.set()
+        await asyncio.gather(*open_sessions, return_exceptions=True)
+
+    return memory_summary(growth, measured='server RSS', server_rss_kib=baseline)
+
+
+def measure_server_memory(server, n_sessions, rng, timeout):
+    """
+    Measure how much the Streamlit process grows for each open session.
+
+    Sessions are opened one after another and kept connected, so the growth
+    in the server's resident memory after each one is charged to it.
+
+    Args:
+        server (StreamlitServer): Server to drive
+        n_sessions (int): Number of sessions to open
+        rng (random.Random): Seeded random generator for form inputs
+        timeout (float): Seconds allowed for each script run
+
+    Returns:
+        dict: Per-session memory growth in KiB
+    """
+    return asyncio.run(measure_server_memory_async(server, n_sessions, rng, timeout))
+
+
+def git_revision():
+    """
+    Return the current git commit, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=APP_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_load_test(levels, sessions, memory_sessions, seed, timeout, mode="server"):
+    """
+    Run the full load test and build the report.
+
+    Args:
+        levels (list): Concurrency levels to test, in increasing order
+        sessions (int): Sessions to run at each concurrency level
+        memory_sessions (int): Sessions to hold open for the memory test
+        seed (int): Seed for the generated form inputs
+        timeout (float): Seconds allowed for each script run
+        mode (str): "server" or "apptest", see the module docstring
+
+    Returns:
+        dict: The load test report
+    """
+    rng = random.Random(seed)
+    server = StreamlitServer(timeout) if mode == "server" else None
+
+    try:
+        if server is not None:
+            # Untimed session so model training doesn't skew the first level
+            run_server_sessions(server, 1, [random_form_input(random.Random(WARM_UP_SEED))], timeout)
+
+        results = []
+        for concurrency in levels:
+            result = run_level(concurrency, sessions, rng, timeout, server)
+            results.append(result)
+            print(
+                f"concurrency={concurrency:>3}  "
+                f"throughput={result['throughput_sessions_per_s']:.2f}/s  "
+                f"submit p50={result['steps'].get('submit', {}).get('p50_ms', 'n/a')}ms  "
+                f"failures={result['failures']}"
+            )
+
+        # A failed memory run must not throw away the level results
+        try:
+            if server is not None:
+                memory = measure_server_memory(server, memory_sessions, rng, timeout)
+            else:
+                memory = measure_apptest_memory(memory_sessions, rng, timeout)
+        except Exception as e:
+            memory = {'sessions': memory_sessions, 'error': str(e) or type(e).__name__}
+    finally:
+        if server is not None:
+            server.close()
+
+    return {
+        'generated_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'config': {
+            'mode': mode,
+            'mode_note': MODE_NOTES[mode],
+            'levels': levels,
+            'sessions_per_level': sessions,
+            'memory_sessions': memory_sessions,
+            'seed': seed,
+            'timeout_s': timeout,
+        },
+        'levels': results,
+        'saturation_concurrency': find_saturation(results),
+        'memory': memory,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the heart disease Streamlit app")
+    parser.add_argument("--mode", choices=MODES, default="server",
+                        help="Drive a local `streamlit run` (server) or AppTest worker processes (apptest)")
+    parser.add_argument("--levels", default="1,2,4,8,16",
+                        help="Comma-separated concurrency levels (default: 1,2,4,8,16)")
+    parser.add_argument("--sessions", type=int, default=32,
+                        help="Sessions to run at each level (default: 32)")
+    parser.add_argument("--memory-sessions", type=int, default=10,
+                        help="Sessions to hold open when measuring memory (default: 10)")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="Seed for generated form inputs (default: 42)")
+    parser.add_argument("--timeout", type=float, default=30,
+                        help="Seconds allowed for each script run (default: 30)")
+    parser.add_argument("--output", default="load_test_report.json",
+                        help="Where to write the JSON report (default: load_test_report.json)")
+    args = parser.parse_args()
+
+    levels = sorted(int(level) for level in args.levels.split(","))
+    if levels[0] < 1:
+        parser.error("--levels must all be at least 1")
+    if args.sessions < 1:
+        parser.error("--sessions must be at least 1")
+    if args.memory_sessions < 1:
+        parser.error("--memory-sessions must be at least 1")
+    report = run_load_test(levels, args.sessions, args.memory_sessions, args.seed, args.timeout, args.mode)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"Mode: {args.mode}. {MODE_NOTES[args.mode]}")
+    print(f"Saturation at concurrency: {report['saturation_concurrency'] or 'not reached'}")
+    memory = report['memory']
+    if 'error' in memory:
+        print(f"Memory measurement failed: {memory['error']}")
+    else:
+        print(f"Memory per live session: {memory['mean_kib']} KiB (max {memory['max_kib']} KiB)")
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,475 @@
+"""
+Streaming monitoring of model inputs and prediction rates.
+
+Every prediction updates a fixed-size summary: a histogram per input
+feature, the counts of positive predictions (overall and over a sliding
+window of recent predictions) and how often each diet recommendation
+category is given. Memory use does not grow with traffic and no individual
+patient's data is kept.
+
+Each process that makes predictions (the Streamlit app, the scoring
+worker) periodically writes its summary to its own small JSON snapshot,
+e.g. monitoring_snapshot.app.json. The snapshots are merged and compared
+against the model's training data to spot drift:
+
+    python prediction_monitor.py [snapshot ...]
+
+Set HEART_MONITOR_PATH to change the base name of the snapshot files (an
+empty value keeps the summaries in memory only) and
+HEART_MONITOR_FLUSH_SECONDS to change how often they are written.
+"""
+import atexit
+import datetime
+import glob
+import json
+import math
+import os
+import sys
+import threading
+from collections import deque
+
+DEFAULT_PATH = os.environ.get("HEART_MONITOR_PATH", "monitoring_snapshot.json")
+DEFAULT_FLUSH_SECONDS = float(os.environ.get("HEART_MONITOR_FLUSH_SECONDS", "60"))
+DEFAULT_WINDOW = 1000
+
+SNAPSHOT_VERSION = 1
+
+# (lowest value, highest value, bin width) per feature. Bounds follow the
+# input limits in app.py; values outside them land in the end bins.
+FEATURE_BINS = {
+    'age': (0, 120, 5),
+    'sex': (0, 2, 1),
+    'blood_pressure': (50, 300, 10),
+    'cholesterol': (100, 600, 20),
+    'chest_pain_type': (0, 4, 1),
+}
+
+# Population stability index thresholds commonly used for drift
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+
+
+def bin_count(feature):
+    low, high, width = FEATURE_BINS[feature]
+    return math.ceil((high - low) / width)
+
+
+def bin_index(feature, value):
+    """
+    Find the histogram bin a feature value falls into.
+
+    Args:
+        feature (str): Feature name from FEATURE_BINS
+        value (float): Feature value
+
+    Returns:
+        int: Bin index, clamped to the first and last bin
+    """
+    low, _, width = FEATURE_BINS[feature]
+    index = int((value - low) // width)
+    return min(max(index, 0), bin_count(feature) - 1)
+
+
+def histogram_quantile(feature, counts, q):
+    """
+    Estimate a quantile from a histogram, interpolating within the bin.
+
+    Args:
+        feature (str): Feature name from FEATURE_BINS
+        counts (list): Bin counts
+        q (float): Quantile between 0 and 1
+
+    Returns:
+        float: Estimated quantile, or None for an empty histogram
+    """
+    total = sum(counts)
+    if total == 0:
+        return None
+    low, _, width = FEATURE_BINS[feature]
+    target = q * total
+    seen = 0
+    for index, count in enumerate(counts):
+        if count and seen + count >= target:
+            return low + width * (index + (target - seen) / count)
+        seen += count
+    return low + width * len(counts)
+
+
+def population_stability_index(expected, actual):
+    """
+    Compare two histograms over the same bins.
+
+    Args:
+        expected (list): Reference bin counts
+        actual (list): Observed bin counts
+
+    Returns:
+        float: PSI, 0 for identical distributions and larger for more drift
+    """
+    expected_total = sum(expected)
+    actual_total = sum(actual)
+    psi = 0.0
+    for e, a in zip(expected, actual):
+        # Smooth empty bins so they don't divide by or take the log of zero
+        e_share = max(e / expected_total, 1e-4)
+        a_share = max(a / actual_total, 1e-4)
+        psi += (a_share - e_share) * math.log(a_share / e_share)
+    return psi
+
+
+class PredictionMonitor:
+    """
+    Constant-memory summary of the predictions made by the model.
+
+    Safe to share between threads, such as concurrent Streamlit sessions.
+    """
+
+    def __init__(self, path=None, flush_seconds=DEFAULT_FLUSH_SECONDS, window=DEFAULT_WINDOW):
+        """
+        Args:
+            path (str): Snapshot file, or None/empty to keep the summary in memory only
+            flush_seconds (float): Time between snapshot writes once started
+            window (int): Number of recent predictions in the positive-rate window
+        """
+        self.path = path or None
+        self.flush_seconds = flush_seconds
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.started_at = datetime.datetime.now().isoformat(timespec='seconds')
+        self.count = 0
+        self.positives = 0
+        self.recent = deque(maxlen=window)
+        self.histograms = {feature: [0] * bin_count(feature) for feature in FEATURE_BINS}
+        self.categories = {}
+        self.dirty = False
+        self.stopped = threading.Event()
+        self.flush_thread = None
+
+    def observe(self, input_data, has_heart_disease, diet_recommendations=None):
+        """
+        Record one prediction.
+
+        Args:
+            input_data (dict): Dictionary containing user health information
+            has_heart_disease (bool): The model's prediction
+            diet_recommendations (dict): Diet recommendations given, if any
+        """
+        # Bin every feature before touching any state, so a bad input
+        # (missing feature, NaN) leaves the summary consistent
+        try:
+            bins = {feature: bin_index(feature, input_data[feature]) for feature in FEATURE_BINS}
+        except (KeyError, TypeError, ValueError, OverflowError) as e:
+            print(f"Skipping unmonitorable prediction input: {e!r}", file=sys.stderr)
+            return
+
+        with self.lock:
+            self.dirty = True
+            self.count += 1
+            self.positives += bool(has_heart_disease)
+            self.recent.append(bool(has_heart_disease))
+            for feature, index in bins.items():
+                self.histograms[feature][index] += 1
+            for category in diet_recommendations or ():
+                self.categories[category] = self.categories.get(category, 0) + 1
+
+    def recent_positive_rate(self):
+        with self.lock:
+            return sum(self.recent) / len(self.recent) if self.recent else None
+
+    def snapshot(self):
+        """
+        Build a JSON-serialisable copy of the current summary.
+
+        Returns:
+            dict: Snapshot of counts, window and histograms
+        """
+        with self.lock:
+            return {
+                'version': SNAPSHOT_VERSION,
+                'started_at': self.started_at,
+                'updated_at': datetime.datetime.now().isoformat(timespec='seconds'),
+                'count': self.count,
+                'positives': self.positives,
+                'window_size': self.recent.maxlen,
+                'recent': ''.join('1' if p else '0' for p in self.recent),
+                'histograms': {feature: list(counts) for feature, counts in self.histograms.items()},
+                'categories': dict(self.categories),
+            }
+
+    def flush(self):
+        """
+        Write the snapshot file, replacing the previous one atomically.
+        Does nothing if no predictions were recorded since the last write.
+        """
+        if not self.path:
+            return
+        with self.flush_lock:
+            with self.lock:
+                if not self.dirty:
+                    return
+            snapshot = self.snapshot()
+            data = json.dumps(snapshot, separators=(',', ':'))
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w") as f:
+                f.write(data)
+            os.replace(temp_path, self.path)
+            # Only clean once written, and only if nothing was observed while
+            # writing, so a failed write is retried and no prediction is lost
+            with self.lock:
+                if self.count == snapshot['count']:
+                    self.dirty = False
+
+    def flush_safely(self):
+        # Monitoring must never take down the process it runs in
+        try:
+            self.flush()
+        except OSError as e:
+            print(f"Could not write monitoring snapshot: {e}", file=sys.stderr)
+
+    def flush_periodically(self):
+        while not self.stopped.wait(self.flush_seconds):
+            self.flush_safely()
+
+    def start(self):
+        """
+        Write the snapshot every flush_seconds from a background thread, so
+        the last predictions are saved even if traffic stops.
+        """
+        if not self.path or self.flush_thread:
+            return
+        self.flush_thread = threading.Thread(
+            target=self.flush_periodically, name="prediction-monitor-flush", daemon=True
+        )
+        self.flush_thread.start()
+
+    def close(self):
+        """
+        Stop the background writer and write a final snapshot.
+        """
+        self.stopped.set()
+        self.flush_safely()
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """
+        Create a monitor that continues from a saved snapshot.
+
+        Args:
+            path (str): Snapshot file; a missing file starts an empty monitor
+
+        Returns:
+            PredictionMonitor: The restored monitor
+        """
+        monitor = cls(path, **kwargs)
+        if not path or not os.path.exists(path):
+            return monitor
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable monitoring snapshot {path}: {e}", file=sys.stderr)
+            return monitor
+        try:
+            if data.get('version') != SNAPSHOT_VERSION:
+                return monitor
+            started_at = str(data['started_at'])
+            count = int(data['count'])
+            positives = int(data['positives'])
+            if not isinstance(data['recent'], str):
+                raise TypeError("recent must be a string")
+            recent = [bit == '1' for bit in data['recent']]
+            histograms = {}
+            for feature, counts in monitor.histograms.items():
+                saved = [int(c) for c in data['histograms'][feature]]
+                if len(saved) != len(counts):
+                    raise ValueError(f"wrong number of bins for {feature}")
+                histograms[feature] = saved
+            categories = {str(k): int(v) for k, v in data['categories'].items()}
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            # Right version but damaged or hand-edited; start afresh rather
+            # than fail the import of the app or worker
+            print(f"Ignoring unreadable monitoring snapshot {path}: {e!r}", file=sys.stderr)
+            return monitor
+
+        monitor.started_at = started_at
+        monitor.count = count
+        monitor.positives = positives
+        monitor.recent.extend(recent)
+        monitor.histograms = histograms
+        monitor.categories = categories
+        return monitor
+
+def snapshot_path(source, base=DEFAULT_PATH):
+    """
+    Build the snapshot file name for one source of predictions.
+
+    Every process writes only its own counts, so processes must never share
+    a snapshot file or they would overwrite each other's data.
+
+    Args:
+        source (str): Name of the process, e.g. "app" or "scoring"
+        base (str): Base snapshot path, or empty for no snapshot
+
+    Returns:
+        str: Path such as monitoring_snapshot.app.json, or None
+    """
+    if not base:
+        return None
+    root, ext = os.path.splitext(base)
+    return f"{root}.{source}{ext}"
+
+
+def merge_monitors(monitors):
+    """
+    Combine the summaries from several sources into one in-memory monitor.
+
+    Args:
+        monitors (list): PredictionMonitor instances
+
+    Returns:
+        PredictionMonitor: Monitor holding the combined counts
+    """
+    merged = PredictionMonitor(window=sum(m.recent.maxlen for m in monitors) or DEFAULT_WINDOW)
+    for monitor in monitors:
+        merged.started_at = min(merged.started_at, monitor.started_at)
+        merged.count += monitor.count
+        merged.positives += monitor.positives
+        merged.recent.extend(monitor.recent)
+        for feature, counts in monitor.histograms.items():
+            merged.histograms[feature] = [a + b for a, b in zip(merged.histograms[feature], counts)]
+        for category, count in monitor.categories.items():
+            merged.categories[category] = merged.categories.get(category, 0) + count
+    return merged
+
+
+def training_reference():
+    """
+    Summarise the model's training data with the same bins as the monitor.
+
+    Returns:
+        dict: Training histograms per feature and the model's positive rate
+    """
+    from heart_disease_model import MODEL, generate_training_data
+
+    X, _ = generate_training_data()
+    histograms = {feature: [0] * bin_count(feature) for feature in FEATURE_BINS}
+    for feature, counts in histograms.items():
+        for value in X[feature]:
+            counts[bin_index(feature, value)] += 1
+
+    return {
+        'histograms': histograms,
+        'positive_rate': float(MODEL.predict(X).mean()),
+    }
+
+
+def drift_report(monitor, reference=None):
+    """
+    Compare monitored inputs and positive rate against the training data.
+
+    Args:
+        monitor (PredictionMonitor): Monitor holding live traffic
+        reference (dict): Output of training_reference, computed if omitted
+
+    Returns:
+        dict: Per-feature PSI, status and quantiles, plus positive rates
+    """
+    reference = reference or training_reference()
+    snapshot = monitor.snapshot()
+
+    features = {}
+    for feature, live in snapshot['histograms'].items():
+        train = reference['histograms'][feature]
+        psi = population_stability_index(train, live) if sum(live) else None
+        if psi is None:
+            status = "no data"
+        elif psi >= PSI_SIGNIFICANT:
+            status = "significant drift"
+        elif psi >= PSI_MODERATE:
+            status = "moderate drift"
+        else:
+            status = "stable"
+        features[feature] = {
+            'psi': psi,
+            'status': status,
+            'live_p50': histogram_quantile(feature, live, 0.5),
+            'live_p90': histogram_quantile(feature, live, 0.9),
+            'training_p50': histogram_quantile(feature, train, 0.5),
+            'training_p90': histogram_quantile(feature, train, 0.9),
+        }
+
+    return {
+        'count': snapshot['count'],
+        'features': features,
+        'positive_rate': snapshot['positives'] / snapshot['count'] if snapshot['count'] else None,
+        'recent_positive_rate': monitor.recent_positive_rate(),
+        'training_positive_rate': reference['positive_rate'],
+        'categories': snapshot['categories'],
+    }
+
+
+def format_rate(rate):
+    return "n/a" if rate is None else f"{rate:.1%}"
+
+
+def format_value(value):
+    return "n/a" if value is None else f"{value:.1f}"
+
+
+# One monitor per source in this process
+monitors = {}
+monitors_lock = threading.Lock()
+
+
+def get_monitor(source):
+    """
+    Return the monitor for a source, creating and starting it on first use.
+
+    Args:
+        source (str): Name of the process, e.g. "app" or "scoring"
+
+    Returns:
+        PredictionMonitor: Monitor writing to snapshot_path(source)
+    """
+    with monitors_lock:
+        if source not in monitors:
+            monitor = PredictionMonitor.load(snapshot_path(source))
+            monitor.start()
+            atexit.register(monitor.close)
+            monitors[source] = monitor
+        return monitors[source]
+
+
+def main():
+    pattern = snapshot_path("*")
+    paths = sys.argv[1:] or (sorted(glob.glob(pattern)) if pattern else [])
+    missing = [path for path in paths if not os.path.exists(path)]
+    if not paths or missing:
+        sys.exit(f"No monitoring snapshot at {', '.join(missing) or pattern}")
+
+    report = drift_report(merge_monitors([PredictionMonitor.load(path) for path in paths]))
+
+    print(f"Snapshots: {', '.join(paths)}")
+
+    print(f"Predictions observed: {report['count']}")
+    print(f"Positive rate: {format_rate(report['positive_rate'])} overall, "
+          f"{format_rate(report['recent_positive_rate'])} recent, "
+          f"{format_rate(report['training_positive_rate'])} on training data")
+    print()
+    print(f"{'Feature':<16} {'PSI':>7} {'p50 live/train':>16} {'p90 live/train':>16}  Status")
+    for feature, stats in report['features'].items():
+        psi = "n/a" if stats['psi'] is None else f"{stats['psi']:.3f}"
+        p50 = f"{format_value(stats['live_p50'])}/{format_value(stats['training_p50'])}"
+        p90 = f"{format_value(stats['live_p90'])}/{format_value(stats['training_p90'])}"
+        print(f"{feature:<16} {psi:>7} {p50:>16} {p90:>16}  {stats['status']}")
+
+    if report['categories']:
+        print()
+        print("Recommendation categories:")
+        for category, count in sorted(report['categories'].items(), key=lambda item: -item[1]):
+            print(f"  {category}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+const net = require('net');
+
+// Client for scoring_server.py. See that file for the wire format.
+
+const HEADER_SIZE = 9;
+const STATUS_OK = 0;
+
+const OP_PING = 0;
+const OP_PREDICT = 1;
+const OP_RECOMMEND = 2;
+const OP_ASSESS = 3;
+const OP_REPORT = 4;
+
+const DEFAULT_SOCKET = process.env.SCORING_SOCKET || '/tmp/heart_scoring.sock';
+
+function packFeatures(inputData) {
+  const buffer = Buffer.alloc(10);
+  buffer.writeUInt16BE(inputData.age, 0);
+  buffer.writeUInt16BE(inputData.sex, 2);
+  buffer.writeUInt16BE(inputData.blood_pressure, 4);
+  buffer.writeUInt16BE(inputData.cholesterol, 6);
+  buffer.writeUInt16BE(inputData.chest_pain_type, 8);
+  return buffer;
+}
+
+// A single socket with any number of requests in flight
+class ScoringConnection {
+  constructor(socketPath) {
+    this.socketPath = socketPath;
+    this.pending = new Map();
+    this.nextId = 0;
+    this.buffer = Buffer.alloc(0);
+    this.socket = null;
+  }
+
+  connect() {
+    if (this.socket) {
+      return;
+    }
+    this.socket = net.createConnection(this.socketPath);
+    this.socket.setNoDelay(true);
+    this.socket.on('data', (chunk) => this.onData(chunk));
+    this.socket.on('error', (error) => this.failAll(error));
+    this.socket.on('close', () => {
+      this.socket = null;
+      this.buffer = Buffer.alloc(0);
+      this.failAll(new Error('Scoring server connection closed'));
+    });
+  }
+
+  request(opcode, payload = Buffer.alloc(0)) {
+    this.connect();
+    const requestId = this.nextId;
+    this.nextId = (this.nextId + 1) >>> 0;
+
+    const header = Buffer.alloc(HEADER_SIZE);
+    header.writeUInt32BE(payload.length, 0);
+    header.writeUInt32BE(requestId, 4);
+    header.writeUInt8(opcode, 8);
+
+    return new Promise((resolve, reject) => {
+      this.pending.set(requestId, { resolve, reject });
+      this.socket.write(Buffer.concat([header, payload]));
+    });
+  }
+
+  onData(chunk) {
+    this.buffer = this.buffer.length ? Buffer.concat([this.buffer, chunk]) : chunk;
+
+    // A single chunk may hold several pipelined responses, or part of one
+    while (this.buffer.length >= HEADER_SIZE) {
+      const length = this.buffer.readUInt32BE(0);
+      if (this.buffer.length < HEADER_SIZE + length) {
+        break;
+      }
+      const requestId = this.buffer.readUInt32BE(4);
+      const status = this.buffer.readUInt8(8);
+      const payload = this.buffer.subarray(HEADER_SIZE, HEADER_SIZE + length);
+      this.buffer = this.buffer.subarray(HEADER_SIZE + length);
+
+      const entry = this.pending.get(requestId);
+      if (!entry) {
+        continue;
+      }
+      this.pending.delete(requestId);
+      if (status === STATUS_OK) {
+        entry.resolve(payload);
+      } else {
+        entry.reject(new Error(`Scoring server error: ${payload.toString('utf8')}`));
+      }
+    }
+  }
+
+  failAll(error) {
+    for (const entry of this.pending.values()) {
+      entry.reject(error);
+    }
+    this.pending.clear();
+  }
+
+  close() {
+    if (this.socket) {
+      this.socket.end();
+    }
+  }
+}
+
+// Spreads requests over a fixed number of connections, picking the one
+// with the fewest requests in flight
+class ScoringClient {
+  constructor({ socketPath = DEFAULT_SOCKET, poolSize = 4 } = {}) {
+    this.connections = [];
+    for (let i = 0; i < poolSize; i++) {
+      this.connections.push(new ScoringConnection(socketPath));
+    }
+  }
+
+  request(opcode, payload) {
+    let best = this.connections[0];
+    for (const connection of this.connections) {
+      if (connection.pending.size < best.pending.size) {
+        best = connection;
+      }
+    }
+    return best.request(opcode, payload);
+  }
+
+  async ping() {
+    await this.request(OP_PING);
+  }
+
+  async predictHeartDisease(inputData) {
+    const response = await this.request(OP_PREDICT, packFeatures(inputData));
+    return response[0] === 1;
+  }
+
+  async getDietRecommendations(hasHeartDisease, inputData) {
+    const payload = Buffer.concat([
+      Buffer.from([hasHeartDisease ? 1 : 0]),
+      packFeatures(inputData)
+    ]);
+    const response = await this.request(OP_RECOMMEND, payload);
+    return JSON.parse(response.toString('utf8'));
+  }
+
+  // Prediction and recommendations in a single round trip
+  async assess(inputData) {
+    const response = await this.request(OP_ASSESS, packFeatures(inputData));
+    return {
+      hasHeartDisease: response[0] === 1,
+      recommendations: JSON.parse(response.subarray(1).toString('utf8'))
+    };
+  }
+
+  // The worker scores the features itself for the report
+  async generateReport(inputData, name) {
+    const payload = Buffer.concat([packFeatures(inputData), Buffer.from(name, 'utf8')]);
+    return this.request(OP_REPORT, payload);
+  }
+
+  close() {
+    for (const connection of this.connections) {
+      connection.close();
+    }
+  }
+}
+
+module.exports = { ScoringClient, packFeatures };
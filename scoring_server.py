@@ -0,0 +1,283 @@
+"""
+Long-lived scoring worker for server.js.
+
+Loads the model once and serves predictions, diet recommendations and PDF
+reports over a Unix domain socket, so the Node server can use the real
+model without spawning Python per request.
+
+Usage:
+    python scoring_server.py [--socket /tmp/heart_scoring.sock] [--no-monitor]
+
+--no-monitor keeps the worker's predictions out of drift monitoring; use it
+for benchmarks and other synthetic traffic.
+
+Wire format (all integers big-endian):
+    request:  length (uint32) | request id (uint32) | opcode (uint8) | payload
+    response: length (uint32) | request id (uint32) | status (uint8) | payload
+
+`length` counts the payload bytes only. A client may send any number of
+requests without waiting; responses on a connection come back in request
+order and carry the request id they answer. Status 0 means success, 1
+means the payload is a UTF-8 error message.
+
+Payloads by opcode:
+    PING      -> empty               echoes an empty payload
+    PREDICT   features               -> prediction (uint8, 0 or 1)
+    RECOMMEND prediction | features  -> recommendations as JSON
+    ASSESS    features               -> prediction (uint8) | recommendations as JSON
+    REPORT    features | name        -> PDF bytes
+
+where `features` is age, sex, blood_pressure, cholesterol, chest_pain_type
+packed as five uint16 values and `name` is UTF-8 text. REPORT scores the
+features itself, so a client can't put a result in a report that the model
+didn't produce.
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+
+from heart_disease_model import predict_heart_disease
+from diet_recommendations import get_diet_recommendations
+from report_generator import generate_report
+from prediction_monitor import get_monitor
+
+# Drift monitoring for predictions made by this process, set up by main()
+# unless monitoring is turned off
+MONITOR = None
+
+DEFAULT_SOCKET = os.environ.get("SCORING_SOCKET", "/tmp/heart_scoring.sock")
+
+HEADER = struct.Struct("!IIB")
+FEATURES = struct.Struct("!5H")
+PREDICTION = struct.Struct("!B")
+
+# Refuse frames larger than this rather than buffering them
+MAX_PAYLOAD = 1 << 20
+
+OP_PING = 0
+OP_PREDICT = 1
+OP_RECOMMEND = 2
+OP_ASSESS = 3
+OP_REPORT = 4
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+FEATURE_NAMES = ('age', 'sex', 'blood_pressure', 'cholesterol', 'chest_pain_type')
+
+# Descriptions printed on reports, as offered by the app's form
+CHEST_PAIN_TYPES = {
+    0: "No Pain (Asymptomatic)",
+    1: "Mild Pain (Atypical Angina)",
+    2: "Moderate Pain (Non-anginal)",
+    3: "Severe Pain (Typical Angina)"
+}
+
+
+def unpack_features(payload):
+    """
+    Decode packed features into the input dict used by the model.
+
+    Args:
+        payload (bytes): Five packed uint16 feature values
+
+    Returns:
+        dict: Dictionary containing user health information
+    """
+    return dict(zip(FEATURE_NAMES, FEATURES.unpack(payload)))
+
+
+def encode_recommendations(recommendations):
+    return json.dumps(recommendations, separators=(',', ':')).encode('utf-8')
+
+
+def record_prediction(input_data, has_heart_disease, recommendations=None):
+    """
+    Record a prediction for drift monitoring without ever failing the request.
+    """
+    if MONITOR is None:
+        return
+    try:
+        MONITOR.observe(input_data, has_heart_disease, recommendations)
+    except Exception as e:
+        print(f"Could not record prediction for monitoring: {e}", file=sys.stderr)
+
+
+def handle_ping(payload):
+    return b""
+
+
+def handle_predict(payload):
+    input_data = unpack_features(payload)
+    has_heart_disease = predict_heart_disease(input_data)
+    record_prediction(input_data, has_heart_disease)
+    return PREDICTION.pack(has_heart_disease)
+
+
+def handle_recommend(payload):
+    has_heart_disease = bool(payload[0])
+    input_data = unpack_features(payload[1:])
+    return encode_recommendations(get_diet_recommendations(has_heart_disease, input_data))
+
+
+def handle_assess(payload):
+    input_data = unpack_features(payload)
+    has_heart_disease = predict_heart_disease(input_data)
+    recommendations = get_diet_recommendations(has_heart_disease, input_data)
+    record_prediction(input_data, has_heart_disease, recommendations)
+    return PREDICTION.pack(has_heart_disease) + encode_recommendations(recommendations)
+
+
+def handle_report(payload):
+    # Reports are downloads of an assessment already recorded by ASSESS, so
+    # this scores again without recording, like handle_recommend
+    input_data = unpack_features(payload[:FEATURES.size])
+    name = payload[FEATURES.size:].decode('utf-8')
+    has_heart_disease = predict_heart_disease(input_data)
+    recommendations = get_diet_recommendations(has_heart_disease, input_data)
+    return generate_report(
+        name=name,
+        age=input_data['age'],
+        sex="Male" if input_data['sex'] == 1 else "Female",
+        blood_pressure=input_data['blood_pressure'],
+        cholesterol=input_data['cholesterol'],
+        chest_pain_type=CHEST_PAIN_TYPES[input_data['chest_pain_type']],
+        has_heart_disease=has_heart_disease,
+        diet_recommendations=recommendations
+    )
+
+
+HANDLERS = {
+    OP_PING: handle_ping,
+    OP_PREDICT: handle_predict,
+    OP_RECOMMEND: handle_recommend,
+    OP_ASSESS: handle_assess,
+    OP_REPORT: handle_report,
+}
+
+
+def dispatch(opcode, payload):
+    """
+    Run one request and build its response status and payload.
+
+    Args:
+        opcode (int): Requested operation
+        payload (bytes): Request payload
+
+    Returns:
+        tuple: (status, response payload bytes)
+    """
+    handler = HANDLERS.get(opcode)
+    if handler is None:
+        return STATUS_ERROR, f"Unknown opcode {opcode}".encode('utf-8')
+    try:
+        return STATUS_OK, handler(payload)
+    except Exception as e:
+        return STATUS_ERROR, f"{type(e).__name__}: {e}".encode('utf-8')
+
+
+async def handle_connection(reader, writer):
+    """
+    Serve requests from one client until it disconnects.
+    """
+    try:
+        while True:
+            try:
+                header = await reader.readexactly(HEADER.size)
+            except asyncio.IncompleteReadError:
+                break
+            length, request_id, opcode = HEADER.unpack(header)
+            if length > MAX_PAYLOAD:
+                # The stream can't be resynchronised after an oversized frame
+                message = f"Payload of {length} bytes exceeds limit".encode('utf-8')
+                writer.write(HEADER.pack(len(message), request_id, STATUS_ERROR) + message)
+                break
+            payload = await reader.readexactly(length)
+
+            status, response = dispatch(opcode, payload)
+            writer.write(HEADER.pack(len(response), request_id, status) + response)
+            await writer.drain()
+    except (ConnectionResetError, asyncio.IncompleteReadError):
+        pass
+    except asyncio.CancelledError:
+        # Open connections are cancelled when the worker shuts down; that
+        # is a normal stop, not an error worth a traceback
+        pass
+    finally:
+        writer.close()
+
+
+def socket_in_use(socket_path):
+    """
+    Check whether a live server is accepting connections at socket_path.
+    """
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+async def serve(socket_path):
+    """
+    Listen on a Unix domain socket until SIGTERM or SIGINT.
+
+    Args:
+        socket_path (str): Filesystem path for the socket
+    """
+    if socket_in_use(socket_path):
+        raise RuntimeError(f"Another scoring server is already listening on {socket_path}")
+    # Only a stale socket left by a worker that didn't shut down cleanly
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = await asyncio.start_unix_server(handle_connection, path=socket_path)
+    print(f"Scoring server listening on {socket_path}", flush=True)
+
+    # Process managers stop the worker with SIGTERM, which would otherwise
+    # kill it without removing the socket or saving the monitoring snapshot
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stopping.set)
+
+    try:
+        async with server:
+            await stopping.wait()
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        if MONITOR is not None:
+            MONITOR.close()
+
+
+def main():
+    global MONITOR
+
+    parser = argparse.ArgumentParser(description="Heart disease scoring worker")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET,
+                        help=f"Unix socket path (default: {DEFAULT_SOCKET})")
+    parser.add_argument("--no-monitor", action="store_true",
+                        help="Don't record predictions for drift monitoring")
+    args = parser.parse_args()
+
+    if not args.no_monitor:
+        MONITOR = get_monitor("scoring")
+
+    try:
+        asyncio.run(serve(args.socket))
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as e:
+        sys.exit(str(e))
+
+
+if __name__ == "__main__":
+    main()
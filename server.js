@@ -14,31 +14,44 @@ app.use(bodyParser.json());
 app.use(bodyParser.urlencoded({ extended: true }));
 app.use(express.static('public'));
 
-// Heart disease prediction model
-const model = require('./models/heartDiseaseModel');
+// Heart disease model, diet recommendations and reports are served by the
+// Python scoring worker (scoring_server.py)
+const { ScoringClient } = require('./scoringClient');
+const scoring = new ScoringClient({
+  poolSize: parseInt(process.env.SCORING_POOL_SIZE) || 4
+});
+
+const chestPainOptions = {
+  0: 'No Pain (Asymptomatic)',
+  1: 'Mild Pain (Atypical Angina)',
+  2: 'Moderate Pain (Non-anginal)',
+  3: 'Severe Pain (Typical Angina)'
+};
 
-// Diet recommendations
-const dietRecommendations = require('./models/dietRecommendations');
+function parseInputData(body) {
+  const inputData = {
+    age: parseInt(body.age),
+    sex: body.sex === 'Male' ? 1 : 0,
+    blood_pressure: parseInt(body.blood_pressure),
+    cholesterol: parseInt(body.cholesterol),
+    chest_pain_type: parseInt(body.chest_pain_type)
+  };
+  const valid = Object.values(inputData).every(
+    (value) => Number.isInteger(value) && value >= 0 && value <= 0xffff
+  ) && inputData.chest_pain_type in chestPainOptions;
+  return valid ? inputData : null;
+}
 
 // API endpoint for prediction
-app.post('/api/predict', (req, res) => {
+app.post('/api/predict', async (req, res) => {
+  const inputData = parseInputData(req.body);
+  if (!inputData) {
+    return res.status(400).json({ error: 'Invalid health information' });
+  }
+
   try {
-    const inputData = {
-      age: parseInt(req.body.age),
-      sex: req.body.sex === 'Male' ? 1 : 0,
-      blood_pressure: parseInt(req.body.blood_pressure),
-      cholesterol: parseInt(req.body.cholesterol),
-      chest_pain_type: parseInt(req.body.chest_pain_type)
-    };
-    
-    // Make prediction
-    const hasHeartDisease = model.predictHeartDisease(inputData);
-    
-    // Get diet recommendations
-    const recommendations = dietRecommendations.getDietRecommendations(
-      hasHeartDisease, 
-      inputData
-    );
+    // Make prediction and get diet recommendations in one round trip
+    const { hasHeartDisease, recommendations } = await scoring.assess(inputData);
     
     // Send response
     res.json({
@@ -55,15 +68,21 @@ app.post('/api/predict', (req, res) => {
   }
 });
 
-// Generate PDF report
-app.post('/api/generate-report', (req, res) => {
+// Generate PDF report; the worker scores the input again without recording
+// it, since /api/predict already monitored this assessment
+app.post('/api/generate-report', async (req, res) => {
+  const inputData = parseInputData(req.body);
+  const name = req.body.name;
+  if (!inputData || typeof name !== 'string' || !name) {
+    return res.status(400).json({ error: 'Invalid health information' });
+  }
+
   try {
-    // In a real implementation, this would generate a PDF
-    // For now we'll just return a success message
-    res.json({ 
-      success: true, 
-      message: 'Report would be generated here in a full implementation'
-    });
+    const pdf = await scoring.generateReport(inputData, name);
+
+    res.set('Content-Type', 'application/pdf');
+    res.set('Content-Disposition', 'attachment; filename="heart_health_report.pdf"');
+    res.send(pdf);
   } catch (error) {
     console.error('Report generation error:', error);
     res.status(500).json({ error: 'Failed to generate report' });